@@ -1,9 +1,11 @@
 import sys
 import os
 import yaml
-import glob
 import re
 import markdown
+import itertools
+import uuid
+from concurrent.futures import ProcessPoolExecutor
 
 from ebooklib import epub
 import mimetypes
@@ -16,6 +18,52 @@ CSS_FILE = 'style.css'
 DEFAULT_CONFIG_FILE = 'config.yaml'
 DEFAULT_DIRECTION = 'rtl'
 
+# ルビ変換のパターン。選択肢を1つの正規表現にまとめ、行頭から1回の走査で適用する。
+# 同じ位置で複数の選択肢がマッチしうる場合は、先に書いたものが優先される。
+# 各選択肢は名前付きグループになっており、match.lastgroup で種類を判別する。
+_RUBY_PATTERN = (
+    # パターン1: 括弧のルビ回避 (｜(テキスト) または |(テキスト))
+    r'(?P<ruby_escape>[｜|](?:\(.*?\)|（.*?）))'
+    # パターン2: 縦線付き明示的ルビ (｜ベーステキスト《ルビ》 または |ベーステキスト《ルビ》)
+    # ベーステキストは《を、ルビは》を含まない文字列に限定し、バックトラックを防ぐ
+    r'|(?P<ruby>[｜|](?P<ruby_base>[^《]+)《(?P<ruby_text>[^》]+)》)'
+    # パターン3, 4: 暗黙的なルビ（漢字 + 二重山括弧/括弧）(漢字《ひらがな/カタカナ》)
+    r'|(?P<kanji_ruby>(?P<kanji_base>[一-龠々・]+)'
+    r'(?:《(?P<kanji_text1>[ぁ-んァ-ヶー・]+)》'
+    r'|\((?P<kanji_text2>[ぁ-んァ-ヶー・]+)\)'
+    r'|（(?P<kanji_text3>[ぁ-んァ-ヶー・]+)）))'
+)
+
+# 1行内の変換対象 (ルビ、縦中横、挿絵、改ページ、その他の注記) をまとめた正規表現
+_LINE_RE = re.compile(
+    _RUBY_PATTERN +
+    # 縦中横 ( [[...]] で囲まれた半角英数字記号2～4文字)
+    r'|(?P<tcy>\[\[(?P<tcy_text>[a-zA-Z0-9.,\-:/+]{2,4}?)\]\])'
+    # 挿絵の注記 (［＃挿絵（xxx.png）入る］ など)
+    # 注記の内側は］を含まない文字列に限定し、同じ行の別の注記までマッチが伸びないようにする
+    r'|(?P<image>［＃[^（（］]*[（（]'
+    r'(?P<image_path>[^］]+?\.(?:png|jpe?g|gif|webp))[^］]*?[））][^］]*］)'
+    r'|(?P<page_break>［＃改(?:ページ|丁)］)'
+    r'|(?P<annotation>［＃[^］]+］)'
+)
+# _LINE_RE のいずれかがマッチしうる行に必ず含まれる記号
+_MARKER_RE = re.compile(r'[｜|《(（［\[]')
+# 行全体に対する区切り線・見出しの判定
+_HR_RE = re.compile(r'[	 　＊\−\-ー]+')
+_PART_RE = re.compile(r'第[一二三四五六七八九十0-9０-９]+部')
+_CHAPTER_RE = re.compile(r'第[一二三四五六七八九十0-9０-９]+章')
+# テキストの事前処理で空行として扱う飾り・空白の文字
+_DECORATION_CHARS = frozenset('\t 　◇◆☆★〇○◎●△▲▽▼※〒〓')
+# HTMLに埋め込むタイトル等のエスケープ用の変換表
+_XML_ESCAPE_TABLE = str.maketrans({
+    '&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;', "'": '&#x27;'})
+# 2行以上の空行を段落の区切りとする
+_PARAGRAPH_SPLIT_RE = re.compile(r'\n{3,}')
+# 章タイトルとファイル名のソート
+_CHAPTER_TITLE_PREFIX_RE = re.compile(r'^(エピソード)?[0-9_ ]+：?')
+_SORT_KEY_SPACE_RE = re.compile(r"[\u3000 \t]")
+_SORT_KEY_SPLIT_RE = re.compile(r'(\d+)')
+
 
 def set_metadata(book, config):
     """
@@ -27,51 +75,64 @@ def set_metadata(book, config):
     book.add_author(config['author'])
     book.set_language(config.get('language', DEFAULT_LANGUAGE))
     book.direction = config.get('direction', DEFAULT_DIRECTION)
-    book.set_identifier(f'urn:uuid:{os.urandom(16).hex()}')
+    # 識別子が指定されていなければ、実行ごとにランダムなUUIDを生成する
+    book.set_identifier(config.get('identifier') or f'urn:uuid:{uuid.uuid4()}')
     book.add_metadata('DC', 'description', config.get('description', ''))
     book.add_metadata('DC', 'publisher', config.get('publisher', ''))
     book.add_metadata('DC', 'date', config.get('date', ''))
 
 
 def read_text_file(filepath):
-    encodings_to_try = ['utf-8', 'cp932', 'shift_jis', 'euc-jp', 'iso-8859-1']
+    # utf-8-sig はBOM付きのUTF-8ならBOMを除き、BOMなしならutf-8と同じように読む
+    encodings_to_try = ['utf-8-sig', 'cp932', 'shift_jis', 'euc-jp', 'iso-8859-1']
+
+    # ファイルは1回だけ読み込み、メモリ上でデコードを試す
+    with open(filepath, 'rb') as f:
+        raw = f.read()
 
     for encode in encodings_to_try:
         try:
-            with open(filepath, 'r', encoding=encode) as f:
-                return f.read()
-        except Exception:
+            text = raw.decode(encode)
+        except UnicodeDecodeError:
             continue
+        # テキストモードで開いた場合と同じく、改行コードをLFに統一する
+        return text.replace('\r\n', '\n').replace('\r', '\n')
 
     raise UnicodeDecodeError(f'{filepath} のエンコーディングを検出できませんでした。')
 
 
-def create_content(book, config):
+def create_content(book, config, css):
 
     lang = config.get('language', DEFAULT_LANGUAGE)
     input_dir = config.get('input_directory', INPUT_DIR)
 
-    patterns = ["*.txt", "*.md"]
-    txt_files_unsorted = []
-    for pattern in patterns:
-        txt_files_unsorted.extend(glob.glob(os.path.join(input_dir, pattern)))
+    extensions = ('.txt', '.md')
+    # glob('*.txt') と同じく、ドットで始まるファイルは対象外とする
+    try:
+        with os.scandir(input_dir) as entries:
+            txt_files_unsorted = [
+                entry.path for entry in entries
+                if entry.name.endswith(extensions) and not entry.name.startswith('.') and entry.is_file()]
+    except OSError:
+        txt_files_unsorted = []
 
     def natural_sort_key(s):
-        return [int(text) if text.isdigit() and text.strip() else text.lower() for text in re.split(r'([\s\d_]+)', re.sub(r"[\u3000 \t]", "", s)) if text.strip()]
+        # 数字の並びで分割すると文字列と数値が交互に並ぶため、常に比較可能なキーになる
+        return [int(text) if text.isdigit() else text.lower() for text in _SORT_KEY_SPLIT_RE.split(_SORT_KEY_SPACE_RE.sub("", s))]
     txt_files = sorted(txt_files_unsorted, key=natural_sort_key)
 
     if not txt_files:
-        pattern_str = ', '.join(patterns)
+        pattern_str = ', '.join(f'*{ext}' for ext in extensions)
         print(
             f"'{input_dir}' に {pattern_str} ファイルが見つかりませんでした。")
         return
 
-    css = get_css_file(config)
-
     c1 = epub.EpubHtml(title=config['title'],
                        file_name='title.xhtml', lang=lang)
+    title = config['title'].translate(_XML_ESCAPE_TABLE)
+    author = config['author'].translate(_XML_ESCAPE_TABLE)
     c1.set_content(
-        f"<div class=\"wrap\"><div class=\"title\"><h1>{config['title']}</h1><div class=\"author\">{config['author']}</div></div></div>")
+        f"<div class=\"wrap\"><div class=\"title\"><h1>{title}</h1><div class=\"author\">{author}</div></div></div>")
     c1.add_item(css)
     book.add_item(c1)
 
@@ -82,184 +143,196 @@ def create_content(book, config):
     book.add_item(nav)
     spine_items = [c1]
 
-    for i, textfile in enumerate(txt_files):
-        chapter_title = re.sub(
-            r'^(エピソード)?[0-9_ ]+：?', '', os.path.splitext(os.path.basename(textfile))[0])
-        chapter_no = f'chapter_{i+1}'
-
-        print(f"Processing {textfile} as {chapter_title}: {chapter_no}")
-        content_text = read_text_file(textfile)
-        if textfile.lower().endswith('.md'):
-            content_html = markdown.markdown(
-                content_text,
-                extensions=['extra']
-            )
-        else:
-            content_html = convert_to_html(
-                chapter_title, content_text, book, config)
-
-        chapter_file_name = f'{chapter_no}.xhtml'
-        c = epub.EpubHtml(
-            title=chapter_title, file_name=chapter_file_name, content=content_html, lang=lang)
-        c.add_item(css)
-        book.add_item(c)
-
-        spine_items.append(c)
-        toc_links.append(
-            epub.Link(chapter_file_name, chapter_title, f"toc_chap_{i+1}"))
+    chapter_titles = [
+        _CHAPTER_TITLE_PREFIX_RE.sub('', os.path.splitext(os.path.basename(textfile))[0])
+        for textfile in txt_files]
+
+    for i, (textfile, chapter_title) in enumerate(zip(txt_files, chapter_titles)):
+        print(f"Processing {textfile} as {chapter_title}: chapter_{i+1}")
+
+    # EPUBに追加済みの画像のパス
+    added_image_paths = set()
+
+    # ファイルの読み込みとHTMLへの変換は互いに独立しているため、複数のプロセスで並列に行う
+    # EPUBへの追加は結果を受け取った順 (ファイルの並び順) にこのプロセスで行う
+    with ProcessPoolExecutor() as executor:
+        results = executor.map(
+            convert_file_to_html, txt_files, chapter_titles, itertools.repeat(config))
+
+        for i, (chapter_title, (content_html, image_paths)) in enumerate(
+                zip(chapter_titles, results)):
+            chapter_no = f'chapter_{i+1}'
+
+            for image_path in image_paths:
+                add_image(book, config, image_path, added_image_paths)
+
+            chapter_file_name = f'{chapter_no}.xhtml'
+            c = epub.EpubHtml(
+                title=chapter_title, file_name=chapter_file_name, content=content_html, lang=lang)
+            c.add_item(css)
+            book.add_item(c)
+
+            spine_items.append(c)
+            toc_links.append(
+                epub.Link(chapter_file_name, chapter_title, f"toc_chap_{i+1}"))
 
     book.toc = tuple(toc_links)
     book.add_item(epub.EpubNcx())
     book.spine = spine_items
 
 
+def convert_file_to_html(textfile, chapter_title, config):
+    """
+    テキストファイルを読み込み、HTMLに変換する
+    別プロセスで実行されるため、EPUB Book objectには触れず、参照された画像のパスを返す
+    :param textfile: テキストファイルのパス
+    :param chapter_title: 章タイトル
+    :param config: Configuration dictionary
+    :return: HTMLコンテンツと、本文中で参照された画像のパスのリストのタプル
+    """
+    content_text = read_text_file(textfile)
+    image_paths = []
+    if textfile.lower().endswith('.md'):
+        content_html = markdown.markdown(
+            content_text,
+            extensions=['extra']
+        )
+    else:
+        content_html = convert_to_html(
+            chapter_title, content_text, image_paths, config)
+    return content_html, image_paths
+
+
 def preprocess_text_content(text_content):
     """
     テキストコンテンツを事前処理する
     :param text_content: テキストコンテンツ
     :return: 処理されたテキストコンテンツ
     """
-    # Windowsの改行コード(CRLF)をLFに統一し、3つ以上の連続改行を2つにまとめる
+    # Windowsの改行コード(CRLF)をLFに統一し、飾りだけの行を空行にする
+    # 飾りの行は段落の区切りになるよう、空行を1つ追加する
     processed_text = text_content.replace('\r\n', '\n')
-    processed_text = re.sub(
-        r'^[\t 　◇◆☆★〇○◎●△▲▽▼※〒〓]+$', '\n', processed_text, flags=re.MULTILINE)
-    processed_text = re.sub(r'\n{3,}', '\n\n\n',
-                            processed_text, flags=re.MULTILINE)
-    return processed_text
+    return '\n'.join(
+        '\n' if line and _DECORATION_CHARS.issuperset(line) else line
+        for line in processed_text.split('\n'))
 
 
-def convert_to_html(chapter_title, text_content, book, config):
+def convert_to_html(chapter_title, text_content, image_paths, config):
     """
     テキストコンテンツをHTMLに変換する
     :param text_content: テキストコンテンツ
-    :param book: EPUB Book object
+    :param image_paths: 本文中で参照された画像のパスを追加するリスト
     :param config: Configuration dictionary
     :return: HTMLコンテンツ
     """
     processed_text = preprocess_text_content(text_content)
 
-    html_paragraphs = [f'<h1>{chapter_title}</h1>']
-    # 2つの改行で段落に分割
-    for para_text in processed_text.strip().split('\n\n\n'):
-        if para_text.strip():
-            html_lines_in_paragraph = []
-            # 段落内の各行に分割
-            for single_line in para_text.split('\n'):
-                if single_line.strip():
-                    processed_html_line = convert_line_text_to_html(
-                        single_line.strip(), book, config)
-                    html_lines_in_paragraph.append(processed_html_line)
-
-            if html_lines_in_paragraph:
-                # 処理された行を<br />で結合し、<p>タグで囲む
-                html_paragraphs.append(
-                    '<p>' + '<br />'.join(html_lines_in_paragraph) + '</p>')
-
-
-def convert_line_text_to_html(line_text, book, config):
+    # 2行以上の空行で段落に分割 (3つ以上の連続改行はまとめて1つの区切りになる)
+    # 段落内の各行に分割し、空行を除く
+    paragraphs = (
+        [line for line in map(str.strip, para_text.split('\n')) if line]
+        for para_text in _PARAGRAPH_SPLIT_RE.split(processed_text))
+    # 処理された行を<br />で結合し、<p>タグで囲む
+    html_paragraphs = (
+        '<p>' + '<br />'.join(
+            convert_line_text_to_html(line, image_paths, config) for line in lines) + '</p>'
+        for lines in paragraphs if lines)
+
+    title_html = f'<h1>{chapter_title.translate(_XML_ESCAPE_TABLE)}</h1>'
+    return '\n'.join((title_html, *html_paragraphs))
+
+
+def convert_line_text_to_html(line_text, image_paths, config):
     """
     1行のテキストを処理し、ルビ変換（行頭以外）、縦中横変換を行います。
+    挿絵の画像のパスは image_paths に追加します。
+    ルビのベーステキストや括弧のルビ回避の内側にある縦中横・注記も変換します。
+
+    >>> convert_line_text_to_html('｜[[10]]月《じゅうがつ》', [], {})
+    '<ruby><span class="tcy">10</span>月<rp>(</rp><rt>じゅうがつ</rt><rp>)</rp></ruby>'
+    >>> convert_line_text_to_html('｜東京［＃傍点］《とうきょう》', [], {})
+    '<ruby>東京<rp>(</rp><rt>とうきょう</rt><rp>)</rp></ruby>'
+    >>> convert_line_text_to_html('｜(テキスト［＃注］)', [], {})
+    '(テキスト)'
     """
-    input_dir = config.get('input_directory', INPUT_DIR)
-    processed_line = line_text
-
-    # 1. ルビ変換
-    processed_line = convert_ruby_to_html(processed_line)
-
-    # 2. 縦中横変換 ( [[...]] で囲まれた半角英数字記号2～4文字程度)
-    def tcy_replace_callback(match):
-        content = match.group(1)
-        # 縦中横の対象とする文字種と長さをチェック
-        if re.fullmatch(r'[a-zA-Z0-9.,\-:/+]{2,4}', content):
-            return f'<span class="tcy">{content}</span>'
-        return match.group(0)   # 条件に合わなければ元の文字列を返す (例: [[長すぎる文字列]])
-
-    processed_line = re.sub(
-        r'\[\[([a-zA-Z0-9.,\-:/+]{2,4}?)\]\]', tcy_replace_callback, processed_line)
-
-    # 3. 画像の処理
-    def add_image(match):
-        # 画像のパスを取得し、imgタグを生成
-        image_path = match.group(1)
-        media_type, _ = mimetypes.guess_type(image_path)
-        with open(f'{input_dir}/{image_path}', 'rb') as f:
-            img_data = f.read()
-        image = epub.EpubItem(
-            uid=image_path, file_name=image_path, media_type=media_type, content=img_data)
-        book.add_item(image)
-        return f'<img src="{image_path}" alt="{image_path}"/>'
-
-    processed_line = re.sub(
-        r'［＃.*[（（](.+\.(png|jpe?g|gif|webp)).*[））].*］', add_image, processed_line)
-
-    # 4. 改行処理など
-    processed_line = re.sub(r'^[	 　＊\−\-ー]+$', '<br /><hr />', processed_line)
-    processed_line = re.sub(
-        r'^(第[一二三四五六七八九十0-9０-９]+部.*)$', r'<h3>\1</h3>', processed_line)
-    processed_line = re.sub(
-        r'^(第[一二三四五六七八九十0-9０-９]+章.*)$', r'<h4>\1</h4>', processed_line)
-
-    processed_line = re.sub(r'［＃改(ページ|丁)］', '</p><p><br />', processed_line)
-    processed_line = re.sub(r'［＃.+］', '', processed_line)
+    # 区切り線
+    if _HR_RE.fullmatch(line_text):
+        return '<br /><hr />'
+
+    def replace_callback(match):
+        kind = match.lastgroup
+        if kind == 'tcy':
+            return f'<span class="tcy">{match.group("tcy_text")}</span>'
+        if kind == 'image':
+            # 画像のパスを記録し、imgタグを生成
+            image_path = match.group('image_path')
+            image_paths.append(image_path)
+            return f'<img src="{image_path}" alt="{image_path}"/>'
+        if kind == 'page_break':
+            return '</p><p><br />'
+        if kind == 'annotation':
+            return ''
+        return _replace_ruby(match, convert_markup)
+
+    def convert_markup(text):
+        return _LINE_RE.sub(replace_callback, text)
+
+    # ルビ、縦中横、挿絵、改ページ、注記を1回の走査で変換
+    # 対象の記号を含まない行 (大半の行) は変換を省略する
+    if _MARKER_RE.search(line_text):
+        processed_line = convert_markup(line_text)
+    else:
+        processed_line = line_text
+
+    # 見出し
+    if line_text.startswith('第'):
+        if _PART_RE.match(line_text):
+            return f'<h3>{processed_line}</h3>'
+        if _CHAPTER_RE.match(line_text):
+            return f'<h4>{processed_line}</h4>'
 
     return processed_line
 
 
-def convert_ruby_to_html(text: str) -> str:
+def add_image(book, config, image_path, added_image_paths):
     """
-    テキスト内の特定のルビ表記パターンをHTMLの<ruby>タグ形式に変換します。
-
-    対応するパターンと優先順位:
-    1.  括弧のルビ回避: `｜(テキスト)` または `|(テキスト)` -> `(テキスト)`
-        (括弧の直前に縦線がある場合、ルビとして解釈せず縦線のみを削除)
-    2.  縦線付き明示的ルビ: `｜ベーステキスト《ルビ》` または `|ベーステキスト《ルビ》`
-        (全角または半角の縦線で始まり、ベーステキストの後に二重山括弧でルビが続く)
-    3.  暗黙的なルビ（漢字 + 二重山括弧）: `漢字《ひらがな/カタカナ》`
-        (漢字のベーステキストの後に二重山括弧でルビが続く。縦線は省略可能)
-    4.  暗黙的なルビ（漢字 + 括弧）: `漢字(ひらがな/カタカナ)`
-        (漢字のベーステキストの後に括弧でルビが続く。)
-
-    Args:
-        text: ルビ表記を含む入力文字列。
-
-    Returns:
-        HTMLの<ruby>タグに変換された文字列。
+    挿絵の画像をEPUBに追加する
+    同じ画像が複数回参照されても、読み込みと追加は最初の1回だけ行う
+    :param book: EPUB Book object
+    :param config: Configuration dictionary
+    :param image_path: 入力ディレクトリからの画像の相対パス
+    :param added_image_paths: 追加済みの画像のパスのセット (追加した画像のパスを記録する)
     """
+    if image_path in added_image_paths:
+        return
+    added_image_paths.add(image_path)
+
+    input_dir = config.get('input_directory', INPUT_DIR)
+    media_type, _ = mimetypes.guess_type(image_path)
+    with open(f'{input_dir}/{image_path}', 'rb') as f:
+        img_data = f.read()
+    image = epub.EpubItem(
+        uid=image_path, file_name=image_path, media_type=media_type, content=img_data)
+    book.add_item(image)
 
-    # 処理するパターンのリスト。優先順位の高い順に並べる。
-    # 各要素は (コンパイル済み正規表現, 置換関数) のタプル。
-    # 置換関数はマッチオブジェクトを受け取り、置換後の文字列を返す。
-    patterns = [
-        # パターン1: 括弧のルビ回避 (｜(テキスト) または |(テキスト))
-        # 縦線と括弧内のテキストをキャプチャし、縦線を除去した括弧付きテキストに置換
-        (re.compile(r'[｜|]\((.*?)\)'), lambda m: f'({m.group(1)})'),
-        (re.compile(r'[｜|]（(.*?)）'), lambda m: f'({m.group(1)})'),
-
-        # パターン2: 縦線付き明示的ルビ (｜ベーステキスト《ルビ》 または |ベーステキスト《ルビ》)
-        # 縦線、ベーステキスト、ルビをキャプチャし、<ruby>タグ形式に置換
-        # ベーステキストとルビは非貪欲マッチ(.+?)を使用
-        (re.compile(r'[｜|](.+?)《(.+?)》'),
-         lambda m: f'<ruby>{m.group(1)}<rp>(</rp><rt>{m.group(2)}</rt><rp>)</rp></ruby>'),
-
-        # パターン3: 暗黙的なルビ（漢字 + 二重山括弧）(漢字《ひらがな/カタカナ》)
-        # 漢字、ルビ(ひらがな/カタカナ)をキャプチャし、<ruby>タグ形式に置換
-        (re.compile(r'([一-龠々・]+)《([ぁ-んァ-ヶー・]+)》'),
-         lambda m: f'<ruby>{m.group(1)}<rp>(</rp><rt>{m.group(2)}</rt><rp>)</rp></ruby>'),
-
-        # パターン4: 暗黙的なルビ（漢字 + 括弧）(漢字(ひらがな/カタカナ))
-        # 漢字、ルビ(ひらがな/カタカナ)をキャプチャし、<ruby>タグ形式に置換
-        (re.compile(r'([一-龠々・]+)\(([ぁ-んァ-ヶー・]+)\)'),
-         lambda m: f'<ruby>{m.group(1)}<rp>(</rp><rt>{m.group(2)}</rt><rp>)</rp></ruby>'),
-        (re.compile(r'([一-龠々・]+)（([ぁ-んァ-ヶー・]+)）'),
-         lambda m: f'<ruby>{m.group(1)}<rp>(</rp><rt>{m.group(2)}</rt><rp>)</rp></ruby>'),
-    ]
-
-    processed_text = text
-    # 定義した優先順位で各パターンをテキストに適用
-    for pattern_compiled, replacement_func in patterns:
-        processed_text = pattern_compiled.sub(replacement_func, processed_text)
-
-    return processed_text
+
+def _replace_ruby(match, convert_markup):
+    """
+    _RUBY_PATTERN にマッチしたルビ表記を<ruby>タグ形式に変換します。
+    縦線で始まる表記の内側には縦中横や注記が含まれうるため、convert_markup で変換します。
+    """
+    kind = match.lastgroup
+    if kind == 'ruby_escape':
+        # 縦線を除去した括弧付きテキストに置換
+        return f'({convert_markup(match.group(kind)[2:-1])})'
+    if kind == 'ruby':
+        base = convert_markup(match.group('ruby_base'))
+        ruby = convert_markup(match.group('ruby_text'))
+    else:
+        base = match.group('kanji_base')
+        ruby = match.group('kanji_text1') or match.group(
+            'kanji_text2') or match.group('kanji_text3')
+    return f'<ruby>{base}<rp>(</rp><rt>{ruby}</rt><rp>)</rp></ruby>'
 
 
 def create_epub(config):
@@ -268,7 +341,7 @@ def create_epub(config):
     add_cover_image(book, config)
     css = get_css_file(config)
     book.add_item(css)
-    create_content(book, config)
+    create_content(book, config, css)
     save_epub(book, config)
 
 